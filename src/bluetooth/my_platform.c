@@ -11,6 +11,8 @@
 #include <pico/stdlib.h>      // For to_ms_since_boot
 #include <pico/cyw43_arch.h>  // For controlling the onboard LED
 #include <pico/time.h>        // For repeating timer
+#include <hardware/watchdog.h> // Stall protection
+#include <btstack_run_loop.h> // Run loop timer that feeds the watchdog
 #include <uni.h>              // Bluepad32 main header
 
 #include "config.h"           // Central configuration
@@ -49,6 +51,9 @@ static bool g_y_held = false;  // Track if Y is currently held
 // Timer for arming countdown (runs independently of controller input)
 static struct repeating_timer g_arming_timer;
 
+// Run loop timer that feeds the hardware watchdog
+static btstack_timer_source_t g_watchdog_timer;
+
 // =============================================================================
 // CONTROL MAPPING
 // Map Xbox controller inputs to robot actions (see config.h for settings)
@@ -64,12 +69,12 @@ static int map_range(int value, int in_min, int in_max, int out_min, int out_max
 /**
  * Check arming countdown - called periodically even when no input changes.
  * This ensures the countdown progresses while holding buttons.
+ *
+ * @param now  Current time in ms since boot (read once by the caller)
  */
-static void check_arming_countdown(void) {
+static void check_arming_countdown(uint32_t now) {
     if (!g_motors_initialized) return;
 
-    uint32_t now = to_ms_since_boot(get_absolute_time());
-
     if (g_y_held && g_arm_hold_active && !motor_controller_is_weapon_armed(&g_motors)) {
         uint32_t held_time = now - g_arm_hold_start;
         int seconds_left = (ARM_HOLD_TIME_MS - held_time + 999) / 1000;  // Round up
@@ -100,10 +105,23 @@ static bool arming_timer_callback(struct repeating_timer *t) {
     // This is needed because btstack_run_loop_execute() may not service lwIP
     cyw43_arch_poll();
 
-    check_arming_countdown();
+    check_arming_countdown(to_ms_since_boot(get_absolute_time()));
     return true;  // Keep repeating
 }
 
+/**
+ * Run loop timer callback - feeds the hardware watchdog.
+ * With the threadsafe_background cyw43 arch, BTstack timers run from the
+ * async context's low-priority IRQ, alongside the Bluepad32 and lwIP
+ * callbacks. A stall in any of those callbacks starves the feed and
+ * reboots the board; a stall elsewhere (e.g. the main thread) does not.
+ */
+static void watchdog_timer_handler(btstack_timer_source_t* ts) {
+    watchdog_update();
+    btstack_run_loop_set_timer(ts, WATCHDOG_FEED_INTERVAL_MS);
+    btstack_run_loop_add_timer(ts);
+}
+
 /**
  * Process controller input and drive motors.
  * Uses tank drive: left stick Y = left motor, right stick Y = right motor
@@ -195,6 +213,15 @@ static void my_platform_on_init_complete(void) {
     printf("(Turn on controller or hold pair button)\n");
     printf("\n");
 
+    // Start the watchdog only now - arming above blocks for several seconds
+    if (WATCHDOG_ENABLED) {
+        watchdog_enable(WATCHDOG_TIMEOUT_MS, true);  // Pause while debugging
+        btstack_run_loop_set_timer_handler(&g_watchdog_timer, watchdog_timer_handler);
+        btstack_run_loop_set_timer(&g_watchdog_timer, WATCHDOG_FEED_INTERVAL_MS);
+        btstack_run_loop_add_timer(&g_watchdog_timer);
+        printf("Watchdog enabled (%dms timeout)\n", WATCHDOG_TIMEOUT_MS);
+    }
+
     // Start scanning for controllers
     uni_bt_start_scanning_and_autoconnect_unsafe();
 
@@ -343,13 +370,13 @@ static void my_platform_on_controller_data(uni_hid_device_t* d, uni_controller_t
     }
 
     // Check arming countdown (runs even when no input changes)
-    check_arming_countdown();
+    check_arming_countdown(now);
 
     // Only process if something changed
     if (memcmp(&prev, ctl, sizeof(*ctl)) == 0) {
         // Even if nothing changed, check failsafe
         if (g_motors_initialized) {
-            motor_controller_check_failsafe(&g_motors);
+            motor_controller_check_failsafe(&g_motors, now);
         }
         return;
     }
@@ -362,19 +389,22 @@ static void my_platform_on_controller_data(uni_hid_device_t* d, uni_controller_t
         process_controller_input(gp);
 
         // === DEBUG OUTPUT ===
-        // Print motor status along with controller state
-        int left, right, weapon;
-        bool armed;
-        motor_controller_get_status(&g_motors, &left, &right, &weapon, &armed);
-
-        printf("Motors: L=%+4d%% R=%+4d%% W=%3d%% [%s] | ",
-               left, right, weapon, armed ? "ARMED" : "safe");
-
-        print_buttons(gp->buttons, gp->misc_buttons);
-        printf("| DPad: %-10s", dpad_to_string(gp->dpad));
-        printf("| Sticks: (%+4d,%+4d) (%+4d,%+4d)",
-               gp->axis_x, gp->axis_y, gp->axis_rx, gp->axis_ry);
-        printf("| Trig: %4d %4d\n", gp->brake, gp->throttle);
+        // Print motor status along with controller state.
+        // Blocking USB printf on every input, so only when DEBUG_MODE.
+        if (DEBUG_MODE) {
+            int left, right, weapon;
+            bool armed;
+            motor_controller_get_status(&g_motors, &left, &right, &weapon, &armed);
+
+            printf("Motors: L=%+4d%% R=%+4d%% W=%3d%% [%s] | ",
+                   left, right, weapon, armed ? "ARMED" : "safe");
+
+            print_buttons(gp->buttons, gp->misc_buttons);
+            printf("| DPad: %-10s", dpad_to_string(gp->dpad));
+            printf("| Sticks: (%+4d,%+4d) (%+4d,%+4d)",
+                   gp->axis_x, gp->axis_y, gp->axis_rx, gp->axis_ry);
+            printf("| Trig: %4d %4d\n", gp->brake, gp->throttle);
+        }
     }
 }
 
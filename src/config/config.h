@@ -64,6 +64,13 @@
 #define FAILSAFE_ENABLED     true
 #define FAILSAFE_TIMEOUT_MS  500    // Stop if no command for this long
 
+// Hardware watchdog - reboots if the BTstack/lwIP callbacks stall. The reset
+// drops all PWM outputs, so the ESCs lose signal instead of latching
+// the last commanded pulse.
+#define WATCHDOG_ENABLED           true
+#define WATCHDOG_TIMEOUT_MS        1000   // Reboot if not fed for this long
+#define WATCHDOG_FEED_INTERVAL_MS  100    // How often the run loop feeds it
+
 // Low battery cutoff (disable if no battery sensor connected)
 #define ENABLE_LOW_BATTERY_CUTOFF  false
 
@@ -78,6 +85,12 @@
 #define BATTERY_MAX_VOLTAGE     12.6f   // Fully charged (4.2V/cell)
 #define BATTERY_ADC_RATIO       5.7f    // Voltage divider ratio
 
+// =============================================================================
+// TELEMETRY SETTINGS
+// =============================================================================
+
+#define CPU_TEMP_INTERVAL_MS    1000    // CPU temp changes slowly, sample at 1Hz
+
 // =============================================================================
 // WIFI SETTINGS
 // =============================================================================
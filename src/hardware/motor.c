@@ -24,6 +24,12 @@ void motor_init(motor_t* motor, uint gpio_pin, uint16_t min_us, uint16_t mid_us,
     motor->max_us = max_us;
     motor->last_throttle = 0.0f;
     motor->armed = false;
+    motor->last_level = 0;  // Never a valid level, forces the first write
+
+    // Precompute pulse widths so throttle updates are a table lookup
+    for (uint i = 0; i <= MOTOR_THROTTLE_STEPS; i++) {
+        motor->pulse_lut[i] = min_us + (uint16_t)((i * (uint32_t)(max_us - min_us)) / MOTOR_THROTTLE_STEPS);
+    }
 
     // Configure GPIO for PWM
     gpio_set_function(gpio_pin, GPIO_FUNC_PWM);
@@ -39,13 +45,8 @@ void motor_init(motor_t* motor, uint gpio_pin, uint16_t min_us, uint16_t mid_us,
     // Enable PWM first
     pwm_set_enabled(motor->slice_num, true);
 
-    // ARMING SEQUENCE
-    // Some bidirectional ESCs still need min_us at startup to arm
-
+    // Hold the first arming pulse until motor_run_arming_sequence() runs
     motor_set_pulse_us(motor, ARM_SEQUENCE_ONE);
-    sleep_ms(ARM_SEQUENCE_ONE_DELAY);
-    motor_set_pulse_us(motor, ARM_SEQUENCE_TWO);
-    sleep_ms(ARM_SEQUENCE_TWO_DELAY);
 
     printf("Motor initialized on GPIO %d (slice %d, channel %d)\n",
            gpio_pin, motor->slice_num, motor->channel);
@@ -55,6 +56,23 @@ void motor_init_default(motor_t* motor, uint gpio_pin) {
     motor_init(motor, gpio_pin, ESC_DEFAULT_MIN_US, ESC_DEFAULT_MID_US, ESC_DEFAULT_MAX_US);
 }
 
+void motor_run_arming_sequence(motor_t* const motors[], uint count) {
+    // ARMING SEQUENCE
+    // Some bidirectional ESCs still need min_us at startup to arm.
+    // All ESCs only need the pulse held, so they arm together.
+    printf("Arming %d ESCs...\n", count);
+
+    for (uint i = 0; i < count; i++) {
+        motor_set_pulse_us(motors[i], ARM_SEQUENCE_ONE);
+    }
+    sleep_ms(ARM_SEQUENCE_ONE_DELAY);
+
+    for (uint i = 0; i < count; i++) {
+        motor_set_pulse_us(motors[i], ARM_SEQUENCE_TWO);
+    }
+    sleep_ms(ARM_SEQUENCE_TWO_DELAY);
+}
+
 void motor_set_pulse_us(motor_t* motor, uint16_t us) {
     // Clamp to safety limits
     if (us < ESC_ABS_MIN_US) {
@@ -69,30 +87,39 @@ void motor_set_pulse_us(motor_t* motor, uint16_t us) {
     level = PWM_WRAP - us;
 #endif
 
-    // Debug: print pulse width changes
-    static uint16_t last_level[8] = {0};
-    if (level != last_level[motor->gpio_pin] && motor->gpio_pin < 8) {
+    // Skip the register write if the pulse hasn't changed
+    if (level == motor->last_level) {
+        return;
+    }
+    motor->last_level = level;
+
+    // Debug: print pulse width changes (compiled out unless VERBOSE_LOGGING)
+    if (VERBOSE_LOGGING) {
         printf("GPIO%d: %dus\n", motor->gpio_pin, us);
-        last_level[motor->gpio_pin] = level;
     }
 
     // Set PWM level (with our config, level = microseconds directly)
     pwm_set_chan_level(motor->slice_num, motor->channel, level);
 }
 
+// Helper: Set throttle by table index (0 to MOTOR_THROTTLE_STEPS)
+static void motor_set_throttle_step(motor_t* motor, uint step) {
+    motor_set_pulse_us(motor, motor->pulse_lut[step]);
+    motor->last_throttle = step * (1.0f / MOTOR_THROTTLE_STEPS);
+}
+
 void motor_set_throttle(motor_t* motor, float throttle) {
     // Clamp throttle to 0.0 - 1.0
-    if (throttle < 0.0f) {
-        throttle = 0.0f;
-    } else if (throttle > 1.0f) {
-        throttle = 1.0f;
+    uint step;
+    if (throttle <= 0.0f) {
+        step = 0;
+    } else if (throttle >= 1.0f) {
+        step = MOTOR_THROTTLE_STEPS;
+    } else {
+        step = (uint)(throttle * MOTOR_THROTTLE_STEPS + 0.5f);
     }
 
-    // Map throttle to pulse width
-    uint16_t us = motor->min_us + (uint16_t)(throttle * (motor->max_us - motor->min_us));
-
-    motor_set_pulse_us(motor, us);
-    motor->last_throttle = throttle;
+    motor_set_throttle_step(motor, step);
 }
 
 void motor_set_speed(motor_t* motor, int speed, bool bidirectional) {
@@ -100,16 +127,17 @@ void motor_set_speed(motor_t* motor, int speed, bool bidirectional) {
     if (speed < -100) speed = -100;
     if (speed > 100) speed = 100;
 
-    float throttle;
+    // Integer-only mapping straight into the pulse table
+    uint step;
     if (bidirectional) {
-        // Map -100..100 to 0.0..1.0 (0.5 = stopped)
-        throttle = (speed + 100) / 200.0f;
+        // Map -100..100 to 0..200 (100 = stopped)
+        step = (uint)(speed + 100) * MOTOR_THROTTLE_STEPS / 200;
     } else {
         // Forward only - use absolute value
-        throttle = (float)((speed < 0) ? -speed : speed) / 100.0f;
+        step = (uint)((speed < 0) ? -speed : speed) * MOTOR_THROTTLE_STEPS / 100;
     }
 
-    motor_set_throttle(motor, throttle);
+    motor_set_throttle_step(motor, step);
 }
 
 void motor_stop(motor_t* motor, bool bidirectional) {
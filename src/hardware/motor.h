@@ -20,6 +20,10 @@
 #define ESC_ABS_MIN_US  900
 #define ESC_ABS_MAX_US  2100
 
+// Throttle resolution for the precomputed pulse table.
+// 200 steps maps speed -100..100 (bidirectional) and 0..100 (x2) exactly.
+#define MOTOR_THROTTLE_STEPS  200
+
 // Motor instance structure
 typedef struct {
     uint gpio_pin;           // GPIO pin number
@@ -29,12 +33,15 @@ typedef struct {
     uint16_t mid_us;         // Middle pulse width (stopped)
     uint16_t max_us;         // Maximum pulse width (microseconds)
     float last_throttle;     // Last set throttle value (0.0 - 1.0)
+    uint16_t pulse_lut[MOTOR_THROTTLE_STEPS + 1];  // Throttle step -> pulse width (us)
+    uint16_t last_level;     // Last PWM level written (skip redundant writes)
     bool armed;              // Whether motor is armed
 } motor_t;
 
 /**
  * Initialize a motor on the specified GPIO pin.
- * Sets up PWM at 50Hz and starts with motor stopped.
+ * Sets up PWM at 50Hz and holds the first arming pulse.
+ * Call motor_run_arming_sequence() afterwards to arm the ESC.
  *
  * @param motor     Pointer to motor structure to initialize
  * @param gpio_pin  GPIO pin connected to ESC signal wire
@@ -49,9 +56,20 @@ void motor_init(motor_t* motor, uint gpio_pin, uint16_t min_us, uint16_t mid_us,
  */
 void motor_init_default(motor_t* motor, uint gpio_pin);
 
+/**
+ * Run the ESC arming sequence on several motors at once.
+ * Blocks for ARM_SEQUENCE_ONE_DELAY + ARM_SEQUENCE_TWO_DELAY in total,
+ * regardless of how many motors are passed.
+ *
+ * @param motors  Motors to arm (must already be initialized)
+ * @param count   Number of motors
+ */
+void motor_run_arming_sequence(motor_t* const motors[], uint count);
+
 /**
  * Set raw pulse width in microseconds.
  * Clamped to safety limits (ESC_ABS_MIN_US to ESC_ABS_MAX_US).
+ * Does nothing if the resulting PWM level is already set.
  *
  * @param motor  Motor to control
  * @param us     Pulse width in microseconds
@@ -60,7 +78,7 @@ void motor_set_pulse_us(motor_t* motor, uint16_t us);
 
 /**
  * Set throttle as a value from 0.0 to 1.0.
- * Maps linearly from min_us to max_us.
+ * Maps linearly from min_us to max_us (snapped to MOTOR_THROTTLE_STEPS).
  *
  * @param motor    Motor to control
  * @param throttle Throttle value (0.0 = min_us, 1.0 = max_us)
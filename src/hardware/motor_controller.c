@@ -41,6 +41,14 @@ void motor_controller_init(motor_controller_t* mc) {
     // Initialize weapon motor
     motor_init(&mc->weapon, PIN_WEAPON, WEAPON_MIN_US, WEAPON_MID_US, WEAPON_MAX_US);
 
+    // Arm all ESCs together instead of one after another
+    motor_t* const all_motors[] = {
+        &mc->motor_left_front, &mc->motor_left_back,
+        &mc->motor_right_front, &mc->motor_right_back,
+        &mc->weapon,
+    };
+    motor_run_arming_sequence(all_motors, sizeof(all_motors) / sizeof(all_motors[0]));
+
     // Initialize state
     mc->left_speed = 0;
     mc->right_speed = 0;
@@ -49,11 +57,12 @@ void motor_controller_init(motor_controller_t* mc) {
     mc->last_command_time_ms = to_ms_since_boot(get_absolute_time());
     mc->failsafe_triggered = false;
 
-    // Stop drive motors but arm weapon (no safety arming required)
+    // Put all five ESCs at neutral so the stored speeds match the output
     motor_stop(&mc->motor_left_front, MOTOR_BIDIRECTIONAL);
     motor_stop(&mc->motor_left_back, MOTOR_BIDIRECTIONAL);
     motor_stop(&mc->motor_right_front, MOTOR_BIDIRECTIONAL);
     motor_stop(&mc->motor_right_back, MOTOR_BIDIRECTIONAL);
+    motor_stop(&mc->weapon, MOTOR_BIDIRECTIONAL);
     mc->left_speed = 0;
     mc->right_speed = 0;
 
@@ -70,6 +79,12 @@ void motor_controller_set_left(motor_controller_t* mc, int speed) {
     speed = apply_deadband(speed);
     speed = clamp(speed, -MOTOR_MAX_SPEED, MOTOR_MAX_SPEED);
 
+    // Nothing to do if the speed hasn't changed (still counts as a command)
+    if (speed == mc->left_speed) {
+        update_command_time(mc);
+        return;
+    }
+
     // Drive both left motors together
     motor_set_speed(&mc->motor_left_front, speed, MOTOR_BIDIRECTIONAL);
     motor_set_speed(&mc->motor_left_back, speed, MOTOR_BIDIRECTIONAL);
@@ -81,6 +96,12 @@ void motor_controller_set_right(motor_controller_t* mc, int speed) {
     speed = apply_deadband(speed);
     speed = clamp(speed, -MOTOR_MAX_SPEED, MOTOR_MAX_SPEED);
 
+    // Nothing to do if the speed hasn't changed (still counts as a command)
+    if (speed == mc->right_speed) {
+        update_command_time(mc);
+        return;
+    }
+
     // Drive both right motors together
     motor_set_speed(&mc->motor_right_front, speed, MOTOR_BIDIRECTIONAL);
     motor_set_speed(&mc->motor_right_back, speed, MOTOR_BIDIRECTIONAL);
@@ -103,10 +124,9 @@ void motor_controller_arcade_drive(motor_controller_t* mc, int throttle, int tur
     int right = throttle - turn;
 
     // Normalize if over max speed (preserve ratio)
-    int max_val = abs(left);
-    if (abs(right) > max_val) {
-        max_val = abs(right);
-    }
+    int abs_left = (left < 0) ? -left : left;
+    int abs_right = (right < 0) ? -right : right;
+    int max_val = (abs_right > abs_left) ? abs_right : abs_left;
 
     if (max_val > MOTOR_MAX_SPEED) {
         left = (left * MOTOR_MAX_SPEED) / max_val;
@@ -120,6 +140,12 @@ void motor_controller_arcade_drive(motor_controller_t* mc, int throttle, int tur
 void motor_controller_set_weapon(motor_controller_t* mc, int speed) {
     speed = clamp(speed, 0, MOTOR_MAX_SPEED);
 
+    // Nothing to do if the speed hasn't changed (still counts as a command)
+    if (speed == mc->weapon_speed) {
+        update_command_time(mc);
+        return;
+    }
+
     // Weapon uses same ESC type as drive motors
     motor_set_speed(&mc->weapon, speed, MOTOR_BIDIRECTIONAL);
     mc->weapon_speed = speed;
@@ -163,13 +189,12 @@ void motor_controller_stop_all(motor_controller_t* mc) {
     motor_controller_disarm_weapon(mc);
 }
 
-bool motor_controller_check_failsafe(motor_controller_t* mc) {
+bool motor_controller_check_failsafe(motor_controller_t* mc, uint32_t now_ms) {
     if (!FAILSAFE_ENABLED) {
         return false;
     }
 
-    uint32_t now = to_ms_since_boot(get_absolute_time());
-    uint32_t elapsed = now - mc->last_command_time_ms;
+    uint32_t elapsed = now_ms - mc->last_command_time_ms;
 
     if (elapsed > FAILSAFE_TIMEOUT_MS) {
         if (!mc->failsafe_triggered) {
@@ -95,10 +95,11 @@ void motor_controller_stop_all(motor_controller_t* mc);
 
 /**
  * Check and apply failsafe if no commands received recently.
- * Call this periodically (e.g., every main loop iteration).
+ * Call this once per main loop iteration.
+ * @param now_ms  Current time in ms since boot (read once by the caller)
  * @return true if failsafe was triggered
  */
-bool motor_controller_check_failsafe(motor_controller_t* mc);
+bool motor_controller_check_failsafe(motor_controller_t* mc, uint32_t now_ms);
 
 /**
  * Get current motor status for logging/telemetry.
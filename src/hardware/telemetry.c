@@ -8,9 +8,17 @@
 #include "pico/stdlib.h"
 #include "hardware/adc.h"
 
+// ADC conversion constants (folded at compile time, so each reading
+// is a multiply instead of a divide)
+#define ADC_TO_VOLTS           (3.3f / 4095.0f)  // 3.3V reference, 12-bit
+#define BATTERY_ADC_TO_VOLTS   (ADC_TO_VOLTS * BATTERY_ADC_RATIO)
+#define BATTERY_PERCENT_SCALE  (100.0f / (BATTERY_MAX_VOLTAGE - BATTERY_MIN_VOLTAGE))
+#define TEMP_INV_SLOPE         (1.0f / 0.001721f)  // Datasheet: 1.721 mV/C
+
 // Global telemetry data
 static telemetry_data_t g_telemetry = {0};
 static uint32_t g_start_time_ms = 0;
+static uint32_t g_last_temp_read_ms = 0;
 
 void telemetry_init(void) {
     printf("Initializing telemetry...\n");
@@ -27,6 +35,9 @@ void telemetry_init(void) {
     // Record start time
     g_start_time_ms = to_ms_since_boot(get_absolute_time());
 
+    // Backdate the last temp read so the first update samples it
+    g_last_temp_read_ms = g_start_time_ms - CPU_TEMP_INTERVAL_MS;
+
     // Initial readings
     telemetry_update(0);
 
@@ -46,13 +57,12 @@ float telemetry_read_battery(void) {
     // Convert to voltage
     // ADC reference is 3.3V, 12-bit resolution
     // Then apply voltage divider ratio
-    float voltage = (raw / 4095.0f) * 3.3f * BATTERY_ADC_RATIO;
+    float voltage = raw * BATTERY_ADC_TO_VOLTS;
 
     g_telemetry.battery_voltage = voltage;
 
     // Calculate percentage (linear approximation)
-    float percent = ((voltage - BATTERY_MIN_VOLTAGE) /
-                    (BATTERY_MAX_VOLTAGE - BATTERY_MIN_VOLTAGE)) * 100.0f;
+    float percent = (voltage - BATTERY_MIN_VOLTAGE) * BATTERY_PERCENT_SCALE;
 
     if (percent < 0) percent = 0;
     if (percent > 100) percent = 100;
@@ -73,11 +83,11 @@ float telemetry_read_cpu_temp(void) {
     uint16_t raw = adc_read();
 
     // Convert to voltage
-    float voltage = raw * (3.3f / 4095.0f);
+    float voltage = raw * ADC_TO_VOLTS;
 
     // Convert to temperature using datasheet formula
     // T = 27 - (V - 0.706) / 0.001721
-    float temp = 27.0f - (voltage - 0.706f) / 0.001721f;
+    float temp = 27.0f - (voltage - 0.706f) * TEMP_INV_SLOPE;
 
     g_telemetry.cpu_temp_c = temp;
     g_telemetry.overtemp = (temp > 70.0f);
@@ -87,12 +97,18 @@ float telemetry_read_cpu_temp(void) {
 
 void telemetry_update(uint32_t loop_time_us) {
     // Update uptime
-    g_telemetry.uptime_ms = to_ms_since_boot(get_absolute_time()) - g_start_time_ms;
+    uint32_t now = to_ms_since_boot(get_absolute_time());
+    g_telemetry.uptime_ms = now - g_start_time_ms;
     g_telemetry.loop_time_us = loop_time_us;
 
     // Read sensors
     telemetry_read_battery();
-    telemetry_read_cpu_temp();
+
+    // CPU temp drifts slowly - skip the ADC read on most updates
+    if (now - g_last_temp_read_ms >= CPU_TEMP_INTERVAL_MS) {
+        telemetry_read_cpu_temp();
+        g_last_temp_read_ms = now;
+    }
 }
 
 telemetry_data_t* telemetry_get_data(void) {
@@ -6,6 +6,7 @@
 #include <btstack_run_loop.h>  // BTstack event loop
 #include <pico/cyw43_arch.h>   // CYW43 WiFi/BT chip driver
 #include <pico/stdlib.h>       // Pico standard library
+#include <hardware/watchdog.h> // Detect watchdog resets
 #include <uni.h>               // Bluepad32 main header
 
 #include "config.h"            // Central configuration
@@ -50,6 +51,10 @@ int main() {
     printf("  Initializing...\n");
     printf("==================================================\n\n");
 
+    if (watchdog_enable_caused_reboot()) {
+        printf("WARNING: Rebooted by watchdog (control loop stalled)\n\n");
+    }
+
     // Initialize the CYW43 wireless chip (WiFi + Bluetooth)
     printf("Initializing CYW43 wireless chip...\n");
     if (cyw43_arch_init()) {
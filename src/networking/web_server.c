@@ -10,6 +10,7 @@
 #include <string.h>
 #include "pico/stdlib.h"
 #include "lwip/tcp.h"
+#include "lwip/mem.h"
 
 // State
 static struct tcp_pcb* g_server_pcb = NULL;
@@ -20,16 +21,85 @@ static bool g_running = false;
 #define RESPONSE_BUFFER_SIZE 2048
 static char g_response_buffer[RESPONSE_BUFFER_SIZE];
 
+// Longest request-line prefix a route needs to match
+#define REQUEST_LINE_MAX 64
+
+// Stop waiting for the end of the headers after this many bytes
+#define REQUEST_MAX_LEN 1024
+
+// Poll each connection every second (lwIP poll ticks are 500ms)
+#define HTTP_POLL_INTERVAL 2
+
+// Close a connection after this many polls with no request (~5 seconds,
+// matching the advertised Keep-Alive timeout)
+#define KEEPALIVE_IDLE_POLLS 5
+
+// Per-connection state, held via tcp_arg
+typedef struct {
+    struct pbuf* pending;   // Partial request from earlier segments
+    uint8_t idle_polls;     // Polls since the last received data
+} http_conn_t;
+
 // Forward declarations
 static err_t http_accept(void* arg, struct tcp_pcb* newpcb, err_t err);
 static err_t http_recv(void* arg, struct tcp_pcb* tpcb, struct pbuf* p, err_t err);
-static void http_close(struct tcp_pcb* tpcb);
+static err_t http_poll(void* arg, struct tcp_pcb* tpcb);
+static void http_close(struct tcp_pcb* tpcb, http_conn_t* conn);
 
 // =============================================================================
 // HTML Generation
 // =============================================================================
 
-static int generate_status_page(char* buffer, int max_len) {
+// Static parts of the status page, sent as-is. Only the values between
+// them are formatted per request.
+static const char INDEX_HEAD[] =
+    "HTTP/1.1 200 OK\r\n"
+    "Content-Type: text/html\r\n"
+    "Connection: close\r\n"
+    "\r\n"
+    "<!DOCTYPE html>"
+    "<html><head>"
+    "<meta name='viewport' content='width=device-width,initial-scale=1'>"
+    "<title>" ROBOT_NAME "</title>"
+    "<style>"
+    "body{font-family:monospace;background:#1a1a2e;color:#eee;padding:20px;}"
+    "h1{color:#e94560;}"
+    ".box{background:#16213e;padding:15px;margin:10px 0;border-radius:8px;}"
+    ".label{color:#888;}"
+    ".value{font-size:1.5em;}"
+    ".armed{color:#ff4444;font-weight:bold;}"
+    ".safe{color:#44ff44;}"
+    ".warn{color:#ffaa00;}"
+    ".crit{color:#ff0000;}"
+    ".bar{background:#333;height:20px;border-radius:4px;overflow:hidden;}"
+    ".bar-fill{background:#e94560;height:100%;}"
+    "</style>"
+    "</head><body>"
+    "<h1>" ROBOT_NAME "</h1>";
+
+// Values refresh from /api/status every 2 seconds instead of reloading
+// the whole page
+static const char INDEX_TAIL[] =
+    "<p style='color:#666;'>Live - updates every 2 seconds</p>"
+    "<script>"
+    "function $(i){return document.getElementById(i);}"
+    "function sg(x){return (x>=0?'+':'')+x;}"
+    "function upd(){fetch('/api/status').then(function(r){return r.json();}).then(function(d){"
+    "var m=d.motors,b=d.battery;"
+    "$('w').className='value '+(d.armed?'armed':'safe');"
+    "$('w').textContent=d.armed?'ARMED':'SAFE';"
+    "$('m').textContent='Left: '+sg(m.left)+'% | Right: '+sg(m.right)+'% | Weapon: '+m.weapon+'%';"
+    "$('b').className='value '+(b.critical?'crit':(b.low?'warn':''));"
+    "$('b').textContent=b.voltage.toFixed(2)+'V ('+b.percent+'%)';"
+    "$('bf').style.width=b.percent+'%';"
+    "$('t').innerHTML=d.cpu_temp_c.toFixed(1)+'&deg;C';"
+    "$('u').textContent=Math.floor(d.uptime_ms/1000)+' seconds';"
+    "}).catch(function(){});}"
+    "setInterval(upd,2000);"
+    "</script>"
+    "</body></html>";
+
+static int generate_status_body(char* buffer, int max_len) {
     telemetry_data_t* tel = telemetry_get_data();
 
     int left = 0, right = 0, weapon = 0;
@@ -38,64 +108,34 @@ static int generate_status_page(char* buffer, int max_len) {
         motor_controller_get_status(g_motors, &left, &right, &weapon, &armed);
     }
 
-    // Generate HTML
+    // Generate the dynamic status boxes
     int len = snprintf(buffer, max_len,
-        "HTTP/1.1 200 OK\r\n"
-        "Content-Type: text/html\r\n"
-        "Connection: close\r\n"
-        "Refresh: 2\r\n"  // Auto-refresh every 2 seconds
-        "\r\n"
-        "<!DOCTYPE html>"
-        "<html><head>"
-        "<meta name='viewport' content='width=device-width,initial-scale=1'>"
-        "<title>%s</title>"
-        "<style>"
-        "body{font-family:monospace;background:#1a1a2e;color:#eee;padding:20px;}"
-        "h1{color:#e94560;}"
-        ".box{background:#16213e;padding:15px;margin:10px 0;border-radius:8px;}"
-        ".label{color:#888;}"
-        ".value{font-size:1.5em;}"
-        ".armed{color:#ff4444;font-weight:bold;}"
-        ".safe{color:#44ff44;}"
-        ".warn{color:#ffaa00;}"
-        ".crit{color:#ff0000;}"
-        ".bar{background:#333;height:20px;border-radius:4px;overflow:hidden;}"
-        ".bar-fill{background:#e94560;height:100%%;}"
-        "</style>"
-        "</head><body>"
-        "<h1>%s</h1>"
-
         "<div class='box'>"
         "<div class='label'>WEAPON STATUS</div>"
-        "<div class='value %s'>%s</div>"
+        "<div class='value %s' id='w'>%s</div>"
         "</div>"
 
         "<div class='box'>"
         "<div class='label'>Motors</div>"
-        "<div>Left: %+d%% | Right: %+d%% | Weapon: %d%%</div>"
+        "<div id='m'>Left: %+d%% | Right: %+d%% | Weapon: %d%%</div>"
         "</div>"
 
         "<div class='box'>"
         "<div class='label'>Battery</div>"
-        "<div class='value %s'>%.2fV (%d%%)</div>"
-        "<div class='bar'><div class='bar-fill' style='width:%d%%;'></div></div>"
+        "<div class='value %s' id='b'>%.2fV (%d%%)</div>"
+        "<div class='bar'><div class='bar-fill' id='bf' style='width:%d%%;'></div></div>"
         "</div>"
 
         "<div class='box'>"
         "<div class='label'>CPU Temperature</div>"
-        "<div class='value'>%.1f&deg;C</div>"
+        "<div class='value' id='t'>%.1f&deg;C</div>"
         "</div>"
 
         "<div class='box'>"
         "<div class='label'>Uptime</div>"
-        "<div>%lu seconds</div>"
-        "</div>"
+        "<div id='u'>%lu seconds</div>"
+        "</div>",
 
-        "<p style='color:#666;'>Auto-refresh every 2 seconds</p>"
-        "</body></html>",
-
-        ROBOT_NAME,  // <title>
-        ROBOT_NAME,  // <h1>
         armed ? "armed" : "safe",
         armed ? "ARMED" : "SAFE",
         left, right, weapon,
@@ -110,56 +150,174 @@ static int generate_status_page(char* buffer, int max_len) {
     return len;
 }
 
-static int generate_404(char* buffer, int max_len) {
+static bool send_status_page(struct tcp_pcb* tpcb) {
+    int body_len = generate_status_body(g_response_buffer, RESPONSE_BUFFER_SIZE);
+
+    // MORE on all but the last write lets lwIP pack the pieces into
+    // full segments instead of pushing each one separately.
+    // Constants live in flash for good, so lwIP can reference them
+    // without copying; only the formatted body needs COPY.
+    tcp_write(tpcb, INDEX_HEAD, sizeof(INDEX_HEAD) - 1, TCP_WRITE_FLAG_MORE);
+    tcp_write(tpcb, g_response_buffer, body_len, TCP_WRITE_FLAG_COPY | TCP_WRITE_FLAG_MORE);
+    tcp_write(tpcb, INDEX_TAIL, sizeof(INDEX_TAIL) - 1, 0);
+    return false;
+}
+
+// Fixed-shape JSON status for pollers, hand-formatted in one pass.
+// Kept alive so the dashboard can poll without reconnecting each time.
+static const char JSON_HEAD_FMT[] =
+    "HTTP/1.1 200 OK\r\n"
+    "Content-Type: application/json\r\n"
+    "Content-Length: %d\r\n"
+    "Connection: keep-alive\r\n"
+    "Keep-Alive: timeout=5\r\n"
+    "\r\n";
+
+static int generate_status_json(char* buffer, int max_len) {
+    telemetry_data_t* tel = telemetry_get_data();
+
+    int left = 0, right = 0, weapon = 0;
+    bool armed = false;
+    if (g_motors) {
+        motor_controller_get_status(g_motors, &left, &right, &weapon, &armed);
+    }
+
     return snprintf(buffer, max_len,
-        "HTTP/1.1 404 Not Found\r\n"
-        "Content-Type: text/html\r\n"
-        "Connection: close\r\n"
-        "\r\n"
-        "<html><body><h1>404 Not Found</h1></body></html>"
+        "{\"armed\":%s,"
+        "\"motors\":{\"left\":%d,\"right\":%d,\"weapon\":%d},"
+        "\"battery\":{\"voltage\":%.2f,\"percent\":%d,\"low\":%s,\"critical\":%s},"
+        "\"cpu_temp_c\":%.1f,"
+        "\"uptime_ms\":%lu}",
+        armed ? "true" : "false",
+        left, right, weapon,
+        tel->battery_voltage,
+        tel->battery_percent,
+        tel->battery_low ? "true" : "false",
+        tel->battery_critical ? "true" : "false",
+        tel->cpu_temp_c,
+        tel->uptime_ms
     );
 }
 
+static bool send_status_json(struct tcp_pcb* tpcb) {
+    int body_len = generate_status_json(g_response_buffer, RESPONSE_BUFFER_SIZE);
+
+    char head[sizeof(JSON_HEAD_FMT) + 8];
+    int head_len = snprintf(head, sizeof(head), JSON_HEAD_FMT, body_len);
+
+    tcp_write(tpcb, head, head_len, TCP_WRITE_FLAG_COPY | TCP_WRITE_FLAG_MORE);
+    tcp_write(tpcb, g_response_buffer, body_len, TCP_WRITE_FLAG_COPY);
+    return true;
+}
+
+// Fully static, sent as-is
+static const char RESPONSE_404[] =
+    "HTTP/1.1 404 Not Found\r\n"
+    "Content-Type: text/html\r\n"
+    "Connection: close\r\n"
+    "\r\n"
+    "<html><body><h1>404 Not Found</h1></body></html>";
+
+static bool send_404(struct tcp_pcb* tpcb) {
+    tcp_write(tpcb, RESPONSE_404, sizeof(RESPONSE_404) - 1, 0);  // Static, no copy
+    return false;
+}
+
+// =============================================================================
+// Routing
+// =============================================================================
+
+// Writes the response; returns true to keep the connection open
+typedef bool (*route_handler_t)(struct tcp_pcb* tpcb);
+
+typedef struct {
+    const char* prefix;       // Start of the request line to match
+    size_t prefix_len;        // strlen(prefix), computed at compile time
+    route_handler_t handler;  // Writes the response to the connection
+} route_t;
+
+#define ROUTE(prefix, handler)  { prefix, sizeof(prefix) - 1, handler }
+
+static const route_t g_routes[] = {
+    ROUTE("GET / ",     send_status_page),
+    ROUTE("GET /index", send_status_page),
+    ROUTE("GET /api/status ", send_status_json),
+};
+
+#define NUM_ROUTES  (sizeof(g_routes) / sizeof(g_routes[0]))
+
+static route_handler_t find_route(const char* request) {
+    for (size_t i = 0; i < NUM_ROUTES; i++) {
+        if (strncmp(request, g_routes[i].prefix, g_routes[i].prefix_len) == 0) {
+            return g_routes[i].handler;
+        }
+    }
+    return send_404;
+}
+
 // =============================================================================
 // TCP Callbacks
 // =============================================================================
 
 static err_t http_recv(void* arg, struct tcp_pcb* tpcb, struct pbuf* p, err_t err) {
+    http_conn_t* conn = (http_conn_t*)arg;
+
     if (p == NULL) {
         // Connection closed by client
-        http_close(tpcb);
+        http_close(tpcb, conn);
         return ERR_OK;
     }
 
-    // Get request data
-    char* request = (char*)p->payload;
+    // Reopen the receive window; we hold the data in the pbuf chain
+    tcp_recved(tpcb, p->tot_len);
+    conn->idle_polls = 0;
+
+    if (conn->pending) {
+        pbuf_cat(conn->pending, p);
+        p = conn->pending;
+    }
 
-    // Parse HTTP request (very basic)
-    int response_len = 0;
-    if (strncmp(request, "GET / ", 6) == 0 ||
-        strncmp(request, "GET /index", 10) == 0) {
-        response_len = generate_status_page(g_response_buffer, RESPONSE_BUFFER_SIZE);
-    } else {
-        response_len = generate_404(g_response_buffer, RESPONSE_BUFFER_SIZE);
+    // Wait for the blank line that ends the headers before answering
+    if (pbuf_memfind(p, "\r\n\r\n", 4, 0) == 0xFFFF && p->tot_len < REQUEST_MAX_LEN) {
+        conn->pending = p;
+        return ERR_OK;
     }
+    conn->pending = NULL;
+
+    // Copy the start of the request into a terminated buffer so route
+    // matching never reads past the received data (or across pbufs)
+    char request[REQUEST_LINE_MAX];
+    uint16_t request_len = pbuf_copy_partial(p, request, sizeof(request) - 1, 0);
+    request[request_len] = '\0';
+
+    // Parse HTTP request (very basic) and dispatch
+    bool keep_alive = find_route(request)(tpcb);
 
     // Send response
-    tcp_write(tpcb, g_response_buffer, response_len, TCP_WRITE_FLAG_COPY);
     tcp_output(tpcb);
 
     // Free the pbuf
     pbuf_free(p);
 
-    // Close connection after response
-    http_close(tpcb);
+    // Close connection after response (keep-alive ones close when idle)
+    if (!keep_alive) {
+        http_close(tpcb, conn);
+    }
 
     return ERR_OK;
 }
 
 static void http_err(void* arg, err_t err) {
-    // Error occurred, connection will be freed automatically
-    (void)arg;
+    // Error occurred, connection will be freed automatically.
+    // Only our per-connection state needs freeing.
     (void)err;
+    http_conn_t* conn = (http_conn_t*)arg;
+    if (conn) {
+        if (conn->pending) {
+            pbuf_free(conn->pending);
+        }
+        mem_free(conn);
+    }
 }
 
 static err_t http_accept(void* arg, struct tcp_pcb* newpcb, err_t err) {
@@ -167,17 +325,44 @@ static err_t http_accept(void* arg, struct tcp_pcb* newpcb, err_t err) {
         return ERR_VAL;
     }
 
+    // Per-connection state (lwIP aborts the connection on ERR_MEM)
+    http_conn_t* conn = (http_conn_t*)mem_malloc(sizeof(http_conn_t));
+    if (conn == NULL) {
+        return ERR_MEM;
+    }
+    conn->pending = NULL;
+    conn->idle_polls = 0;
+
     // Set up callbacks for this connection
+    tcp_arg(newpcb, conn);
     tcp_recv(newpcb, http_recv);
     tcp_err(newpcb, http_err);
+    tcp_poll(newpcb, http_poll, HTTP_POLL_INTERVAL);
 
     return ERR_OK;
 }
 
-static void http_close(struct tcp_pcb* tpcb) {
+static err_t http_poll(void* arg, struct tcp_pcb* tpcb) {
+    // Close connections that have gone quiet (the browser just reconnects),
+    // dropping any request that never finished arriving
+    http_conn_t* conn = (http_conn_t*)arg;
+    if (++conn->idle_polls >= KEEPALIVE_IDLE_POLLS) {
+        http_close(tpcb, conn);
+    }
+    return ERR_OK;
+}
+
+static void http_close(struct tcp_pcb* tpcb, http_conn_t* conn) {
+    tcp_arg(tpcb, NULL);
     tcp_recv(tpcb, NULL);
     tcp_err(tpcb, NULL);
+    tcp_poll(tpcb, NULL, 0);
     tcp_close(tpcb);
+
+    if (conn->pending) {
+        pbuf_free(conn->pending);
+    }
+    mem_free(conn);
 }
 
 // =============================================================================